@@ -1,15 +1,197 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 import hashlib
 import json
 from datetime import datetime
 from typing import Dict, List, Optional
 import sqlite3
+import fastjson
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from sqlalchemy.orm import Session
 
+# Optional native proof-of-work accelerator. When a compiled `pow_native`
+# module (SHA-NI / AVX2 multi-buffer SHA-256) is installed it takes over the
+# nonce search; otherwise we fall back to hashlib, whose OpenSSL backend
+# already uses hardware SHA extensions where the CPU supports them.
+try:
+    import pow_native
+except ImportError:
+    pow_native = None
+
+# Optional CUDA proof-of-work backend. Worth the kernel-launch and transfer
+# overhead only once the expected search space is large, i.e. at production
+# difficulties; low-difficulty demo mining stays on the CPU.
+try:
+    import pow_cuda
+except ImportError:
+    pow_cuda = None
+
+# BLAKE3 for non-consensus hashing (Merkle tree levels, verification log
+# digests): SIMD-parallel and several times faster than SHA-256 on large
+# inputs. The proof-of-work and block hashes stay on SHA-256 — those define
+# chain identity. Falls back to SHA-256 when blake3 is not installed.
+try:
+    from blake3 import blake3 as _fast_hash
+except ImportError:
+    _fast_hash = hashlib.sha256
+
 # Blockchain Router for API endpoints
 blockchain_router = APIRouter(prefix="/api/blockchain", tags=["blockchain"])
 
+# Batches smaller than this are verified serially; forking a process pool
+# only pays off when there is a real backlog of unverified blocks
+_PARALLEL_VERIFY_THRESHOLD = 512
+
+# Expected nonce attempts are 16**difficulty; from this difficulty up the
+# search is long enough to amortize GPU kernel launch and host transfers
+_CUDA_DIFFICULTY_THRESHOLD = 6
+
+
+def _find_nonce(prefix: bytes, difficulty: int, max_nonce: int) -> int:
+    """Search for a nonce whose SHA-256(prefix + ascii nonce) has the
+    required number of leading zero hex digits."""
+    if pow_cuda is not None and difficulty >= _CUDA_DIFFICULTY_THRESHOLD:
+        return pow_cuda.find_nonce(prefix, difficulty, max_nonce)
+    if pow_native is not None:
+        return pow_native.find_nonce(prefix, difficulty, max_nonce)
+
+    # Absorb the immutable prefix once and clone the hasher per attempt, so
+    # each nonce trial only hashes the few ASCII nonce bytes instead of
+    # rehashing the whole block preimage.
+    base = hashlib.sha256(prefix)
+
+    # Branchless target test: the digest has `difficulty` leading zero hex
+    # digits iff its top 4*difficulty bits are zero, so one 8-byte load and
+    # a precomputed shift replace the per-byte scan and odd-nibble branch.
+    shift = 64 - 4 * min(difficulty, 16)
+
+    # Hoist bound methods out of the scan loop; per-iteration attribute
+    # lookups and f-string formatting are measurable at millions of attempts.
+    copy = base.copy
+    from_bytes = int.from_bytes
+    for nonce in range(max_nonce + 1):
+        h = copy()
+        h.update(b"%d" % nonce)
+        if from_bytes(h.digest()[:8], 'big') >> shift == 0:
+            return nonce
+    return max_nonce + 1
+
+# Credit block preimage fields in canonical (sorted-key) order, with the
+# cheapest safe formatter for each: 'int' and 'raw' fields are interpolated
+# directly (raw values are hex digests / ISO timestamps that never need
+# escaping), everything else goes through the full JSON serializer.
+_CREDIT_BLOCK_FIELDS = (
+    ('credit_score', 'int'),
+    ('model_version', 'json'),
+    ('prediction_confidence', 'json'),
+    ('previous_hash', 'raw'),
+    ('risk_factors', 'json'),
+    ('timestamp', 'raw'),
+    ('user_id', 'int'),
+)
+
+
+def _compile_credit_preimage():
+    """Generate the canonical credit-block serializer at import time.
+
+    The key order and per-field formatting are baked into generated source,
+    so the hot add/verify paths skip building a dict and sorting its keys on
+    every call. Output is byte-identical to fastjson.dumps_canonical() of
+    the equivalent dict.
+    """
+    parts = []
+    for name, kind in _CREDIT_BLOCK_FIELDS:
+        key = 'b\'"%s":\'' % name
+        if kind == 'int':
+            parts.append('%s + b"%%d" %% %s' % (key, name))
+        elif kind == 'raw':
+            parts.append('%s + b\'"\' + %s.encode() + b\'"\'' % (key, name))
+        else:
+            parts.append('%s + _dumps(%s)' % (key, name))
+    args = ', '.join(name for name, _ in _CREDIT_BLOCK_FIELDS)
+    body = " + b',' + ".join(parts)
+    src = 'def credit_preimage(%s):\n    return b"{" + %s + b"}"\n' % (args, body)
+    namespace = {'_dumps': fastjson.dumps_canonical}
+    exec(compile(src, '<credit-preimage>', 'exec'), namespace)
+    return namespace['credit_preimage']
+
+
+_credit_preimage = _compile_credit_preimage()
+
+
+@lru_cache(maxsize=1024)
+def _merkle_root_cached(leaves: tuple) -> str:
+    """Merkle root of a tuple of raw 32-byte leaf digests.
+
+    Cached on the leaf digests themselves: re-verifying or re-mining over the
+    same transaction set (retries, health checks) skips rebuilding the tree.
+    Block hashes are not cacheable the same way — their preimages embed a
+    fresh timestamp and nonce.
+    """
+    fast_hash = _fast_hash
+
+    # Work iteratively on one flat buffer of 32-byte digests; each level
+    # pairs adjacent 64-byte slices and halves the buffer in place, which
+    # avoids the per-node hex encode/decode and recursion of the old
+    # string-based implementation.
+    level = bytearray(b''.join(leaves))
+    size = len(level)
+    while size > 32:
+        if size % 64:
+            level[size:size + 32] = level[size - 32:size]  # Duplicate odd tail
+            size += 32
+        view = memoryview(level)
+        half = size // 2
+        # _fast_hash is the one level primitive: a second accelerator here
+        # (multi-buffer SHA-256) would make the root depend on which
+        # optional module happens to be installed.
+        for i in range(0, half, 32):
+            level[i:i + 32] = fast_hash(view[2 * i:2 * i + 64]).digest()
+        size = half
+
+    return bytes(level[:32]).hex()
+
+
+def _verify_block(block: tuple, blockchain_type: str) -> bool:
+    """Verify a single block row's hash; module-level so worker processes can
+    run it without pickling a CreditBlockchain instance."""
+    try:
+        if blockchain_type == 'credit_score':
+            block_id, block_hash, previous_hash, user_id, credit_score, model_version, \
+            prediction_confidence, risk_factors, merkle_root, nonce, timestamp, miner_id, block_size, verified = block
+
+            # Recreate the canonical preimage; stored hashes are raw blobs,
+            # the preimage carries them hex-encoded
+            block_json = _credit_preimage(
+                credit_score, model_version, prediction_confidence,
+                previous_hash.hex(), fastjson.loads(risk_factors),
+                timestamp, user_id
+            )
+            final_block_data = block_json + merkle_root.encode() + str(nonce).encode()
+            calculated_hash = hashlib.sha256(final_block_data).digest()
+
+            return calculated_hash == block_hash
+
+        elif blockchain_type == 'transaction':
+            block_id, block_hash, previous_hash, user_id, transaction_type, amount, \
+            transaction_hash, merkle_root, nonce, timestamp, verified = block
+
+            block_string = f"{previous_hash.hex()}{transaction_hash}{merkle_root}"
+            final_block_data = block_string + str(nonce)
+            calculated_hash = hashlib.sha256(final_block_data.encode()).digest()
+
+            return calculated_hash == block_hash
+
+        return False
+
+    except Exception:
+        return False
+
+
 class BlockchainTransaction(BaseModel):
     user_id: int
     transaction_type: str
@@ -34,20 +216,67 @@ class CreditBlockchain:
     
     def __init__(self, db_path: str = 'credit_risk.db'):
         self.db_path = db_path
+        # One long-lived connection shared across requests; opening a fresh
+        # connection (and paying an fsync-heavy commit) per block dominated
+        # ingest cost. WAL lets readers proceed while a block is written.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._db_lock = threading.Lock()
         self._init_blockchain_tables()
+        # Chain tips cached per table; writes are serialized by _db_lock, so
+        # the cache stays authoritative and saves a SELECT per insert.
+        self._latest_hash = {
+            table: self._load_latest_hash(table)
+            for table in ('credit_score_blockchain', 'transaction_blockchain')
+        }
+        # Verification cursor per chain: blocks at or below 'last_id' have
+        # already been checked, so each verify run only hashes new blocks.
+        self._verify_state = {}
         self.difficulty = 4  # Mining difficulty for proof of work
-    
+
+    def _load_latest_hash(self, table_name: str) -> str:
+        """Read the current chain tip for a table from the database"""
+        cursor = self._conn.execute(
+            f'SELECT block_hash FROM {table_name} ORDER BY id DESC LIMIT 1'
+        )
+        result = cursor.fetchone()
+        if result is None:
+            return "0" * 64
+        tip = result[0]
+        # Databases from before the BLOB switch stored hashes as hex TEXT;
+        # the tip is kept hex-encoded internally either way, so accept both
+        # rather than failing at import on an old file
+        return tip if isinstance(tip, str) else tip.hex()
+
     def _init_blockchain_tables(self):
         """Initialize comprehensive blockchain tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
-        
+
+        # Databases from before the BLOB switch stored hashes as 64-char hex
+        # TEXT. Rebuild those tables under the current schema, converting the
+        # hash columns during the copy, so the read paths and the LAG()
+        # linkage checks see one representation instead of a permanent
+        # TEXT-vs-BLOB break at the migration seam.
+        chain_tables = ('credit_score_blockchain', 'transaction_blockchain',
+                        'model_version_blockchain', 'prediction_audit_blockchain')
+        legacy = []
+        for table in chain_tables:
+            row = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                (table,)).fetchone()
+            if row and 'block_hash TEXT' in row[0]:
+                cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+                legacy.append(table)
+
         # Credit score blockchain
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS credit_score_blockchain (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_hash TEXT UNIQUE NOT NULL,
-                previous_hash TEXT NOT NULL,
+                block_hash BLOB UNIQUE NOT NULL,
+                previous_hash BLOB NOT NULL,
                 user_id INTEGER NOT NULL,
                 credit_score INTEGER NOT NULL,
                 model_version TEXT NOT NULL,
@@ -66,8 +295,8 @@ class CreditBlockchain:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS transaction_blockchain (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_hash TEXT UNIQUE NOT NULL,
-                previous_hash TEXT NOT NULL,
+                block_hash BLOB UNIQUE NOT NULL,
+                previous_hash BLOB NOT NULL,
                 user_id INTEGER NOT NULL,
                 transaction_type TEXT NOT NULL,
                 amount REAL NOT NULL,
@@ -83,8 +312,8 @@ class CreditBlockchain:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS model_version_blockchain (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_hash TEXT UNIQUE NOT NULL,
-                previous_hash TEXT NOT NULL,
+                block_hash BLOB UNIQUE NOT NULL,
+                previous_hash BLOB NOT NULL,
                 model_version TEXT NOT NULL,
                 accuracy REAL NOT NULL,
                 training_data_hash TEXT NOT NULL,
@@ -99,8 +328,8 @@ class CreditBlockchain:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS prediction_audit_blockchain (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_hash TEXT UNIQUE NOT NULL,
-                previous_hash TEXT NOT NULL,
+                block_hash BLOB UNIQUE NOT NULL,
+                previous_hash BLOB NOT NULL,
                 user_id INTEGER NOT NULL,
                 input_data_hash TEXT NOT NULL,
                 prediction_hash TEXT NOT NULL,
@@ -124,137 +353,140 @@ class CreditBlockchain:
                 verification_hash TEXT NOT NULL
             )
         ''')
-        
+
+        for table in legacy:
+            rows = cursor.execute(f'SELECT * FROM {table}_legacy ORDER BY id').fetchall()
+            hash_cols = {i for i, col in enumerate(cursor.description)
+                         if col[0] in ('block_hash', 'previous_hash')}
+            placeholders = ','.join('?' * len(cursor.description))
+            cursor.executemany(
+                f'INSERT INTO {table} VALUES ({placeholders})',
+                [tuple(bytes.fromhex(value) if i in hash_cols and isinstance(value, str)
+                       else value
+                       for i, value in enumerate(row))
+                 for row in rows])
+            cursor.execute(f'DROP TABLE {table}_legacy')
+
+        # The risk-factor lookup matches membership anywhere in the JSON
+        # array, which no expression index on one position can serve, so the
+        # earlier primary-factor index was insert overhead that EXPLAIN
+        # showed never being used; drop it from existing databases too
+        cursor.execute('DROP INDEX IF EXISTS idx_credit_score_primary_risk_factor')
+
+        # Composite indexes so per-user history queries are an index walk in
+        # output order instead of a full scan plus sort
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_credit_score_user_timestamp
+            ON credit_score_blockchain(user_id, timestamp DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_transaction_user_timestamp
+            ON transaction_blockchain(user_id, timestamp DESC)
+        ''')
+
         conn.commit()
-        conn.close()
-    
-    def calculate_merkle_root(self, transactions: List[str]) -> str:
-        """Calculate Merkle root for block integrity"""
-        if not transactions:
-            return hashlib.sha256(b'').hexdigest()
-        
-        if len(transactions) == 1:
-            return hashlib.sha256(transactions[0].encode()).hexdigest()
-        
-        # Pair up transactions and hash them
-        next_level = []
-        for i in range(0, len(transactions), 2):
-            if i + 1 < len(transactions):
-                combined = transactions[i] + transactions[i + 1]
-            else:
-                combined = transactions[i] + transactions[i]  # Duplicate if odd number
-            
-            next_level.append(hashlib.sha256(combined.encode()).hexdigest())
-        
-        return self.calculate_merkle_root(next_level)
-    
-    def proof_of_work(self, block_data: str) -> int:
+
+    def calculate_merkle_root(self, leaves: List[bytes]) -> str:
+        """Calculate Merkle root over raw 32-byte leaf digests for block integrity"""
+        if not leaves:
+            return _fast_hash(b'').hexdigest()
+
+        # Single-leaf blocks (the common case here) need no tree at all
+        if len(leaves) == 1:
+            return leaves[0].hex()
+
+        return _merkle_root_cached(tuple(leaves))
+
+    def proof_of_work(self, block_data) -> int:
         """Simple proof of work algorithm"""
-        nonce = 0
-        target = "0" * self.difficulty
-        
-        while True:
-            hash_attempt = hashlib.sha256(f"{block_data}{nonce}".encode()).hexdigest()
-            if hash_attempt.startswith(target):
-                return nonce
-            nonce += 1
-            
-            # Prevent infinite loop in demo
-            if nonce > 1000000:
-                break
-        
-        return nonce
+        if isinstance(block_data, str):
+            block_data = block_data.encode()
+        # Cap the search to prevent an infinite loop in demo
+        return _find_nonce(block_data, self.difficulty, 1000000)
     
     def add_credit_score_block(self, user_id: int, credit_score: int, model_version: str, 
                               prediction_confidence: float, risk_factors: List[str]) -> str:
         """Add credit score to blockchain with enhanced security"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get previous block hash
-        cursor.execute('SELECT block_hash FROM credit_score_blockchain ORDER BY id DESC LIMIT 1')
-        result = cursor.fetchone()
-        previous_hash = result[0] if result else "0" * 64
-        
-        # Create block data
-        block_data = {
-            'user_id': user_id,
-            'credit_score': credit_score,
-            'model_version': model_version,
-            'prediction_confidence': prediction_confidence,
-            'risk_factors': risk_factors,
-            'previous_hash': previous_hash,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Calculate Merkle root
-        transactions = [json.dumps(block_data, sort_keys=True)]
-        merkle_root = self.calculate_merkle_root(transactions)
-        
-        # Proof of work
-        block_string = json.dumps(block_data, sort_keys=True) + merkle_root
-        nonce = self.proof_of_work(block_string)
-        
-        # Generate final block hash
-        final_block_data = block_string + str(nonce)
-        block_hash = hashlib.sha256(final_block_data.encode()).hexdigest()
-        
-        # Insert block
-        cursor.execute('''
-            INSERT INTO credit_score_blockchain 
-            (block_hash, previous_hash, user_id, credit_score, model_version, 
-             prediction_confidence, risk_factors, merkle_root, nonce)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (block_hash, previous_hash, user_id, credit_score, model_version,
-              prediction_confidence, json.dumps(risk_factors), merkle_root, nonce))
-        
-        conn.commit()
-        conn.close()
-        
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            previous_hash = self._latest_hash['credit_score_blockchain']
+        
+            # Create the canonical block preimage
+            timestamp = datetime.now().isoformat()
+            block_json = _credit_preimage(
+                credit_score, model_version, prediction_confidence,
+                previous_hash, risk_factors, timestamp, user_id
+            )
+
+            # Calculate Merkle root over the leaf transaction digests
+            merkle_root = self.calculate_merkle_root([hashlib.sha256(block_json).digest()])
+
+            # Proof of work
+            block_string = block_json + merkle_root.encode()
+            nonce = self.proof_of_work(block_string)
+
+            # Generate final block hash
+            final_block_data = block_string + str(nonce).encode()
+            block_hash = hashlib.sha256(final_block_data).hexdigest()
+
+            # Insert block; hashes are stored as raw 32-byte blobs. The hashed
+            # timestamp is stored explicitly so verification can rebuild the
+            # exact preimage (the column default had a different format, which
+            # made re-verification of credit score blocks impossible).
+            cursor.execute('''
+                INSERT INTO credit_score_blockchain
+                (block_hash, previous_hash, user_id, credit_score, model_version,
+                 prediction_confidence, risk_factors, merkle_root, nonce, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (bytes.fromhex(block_hash), bytes.fromhex(previous_hash), user_id,
+                  credit_score, model_version, prediction_confidence,
+                  fastjson.dumps_canonical(risk_factors).decode(), merkle_root,
+                  nonce, timestamp))
+
+            self._conn.commit()
+            self._latest_hash['credit_score_blockchain'] = block_hash
+
         return block_hash
     
     def add_transaction_block(self, user_id: int, transaction_type: str, amount: float) -> str:
         """Add financial transaction to blockchain"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get previous block hash
-        cursor.execute('SELECT block_hash FROM transaction_blockchain ORDER BY id DESC LIMIT 1')
-        result = cursor.fetchone()
-        previous_hash = result[0] if result else "0" * 64
-        
-        # Create transaction hash
-        transaction_data = {
-            'user_id': user_id,
-            'transaction_type': transaction_type,
-            'amount': amount,
-            'timestamp': datetime.now().isoformat()
-        }
-        transaction_hash = hashlib.sha256(json.dumps(transaction_data, sort_keys=True).encode()).hexdigest()
-        
-        # Calculate Merkle root
-        merkle_root = self.calculate_merkle_root([transaction_hash])
-        
-        # Proof of work
-        block_string = f"{previous_hash}{transaction_hash}{merkle_root}"
-        nonce = self.proof_of_work(block_string)
-        
-        # Generate block hash
-        final_block_data = block_string + str(nonce)
-        block_hash = hashlib.sha256(final_block_data.encode()).hexdigest()
-        
-        # Insert block
-        cursor.execute('''
-            INSERT INTO transaction_blockchain 
-            (block_hash, previous_hash, user_id, transaction_type, amount, 
-             transaction_hash, merkle_root, nonce)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (block_hash, previous_hash, user_id, transaction_type, amount,
-              transaction_hash, merkle_root, nonce))
-        
-        conn.commit()
-        conn.close()
-        
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            previous_hash = self._latest_hash['transaction_blockchain']
+
+            # Create transaction hash
+            transaction_data = {
+                'user_id': user_id,
+                'transaction_type': transaction_type,
+                'amount': amount,
+                'timestamp': datetime.now().isoformat()
+            }
+            transaction_digest = hashlib.sha256(fastjson.dumps_canonical(transaction_data)).digest()
+            transaction_hash = transaction_digest.hex()
+
+            # Calculate Merkle root over the leaf transaction digests
+            merkle_root = self.calculate_merkle_root([transaction_digest])
+
+            # Proof of work
+            block_string = f"{previous_hash}{transaction_hash}{merkle_root}"
+            nonce = self.proof_of_work(block_string)
+
+            # Generate block hash
+            final_block_data = block_string + str(nonce)
+            block_hash = hashlib.sha256(final_block_data.encode()).hexdigest()
+
+            # Insert block; hashes are stored as raw 32-byte blobs
+            cursor.execute('''
+                INSERT INTO transaction_blockchain
+                (block_hash, previous_hash, user_id, transaction_type, amount,
+                 transaction_hash, merkle_root, nonce)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (bytes.fromhex(block_hash), bytes.fromhex(previous_hash), user_id,
+                  transaction_type, amount, transaction_hash, merkle_root, nonce))
+
+            self._conn.commit()
+            self._latest_hash['transaction_blockchain'] = block_hash
+
         return block_hash
     
     def verify_blockchain_integrity(self, blockchain_type: str = 'credit_score') -> Dict:
@@ -267,34 +499,69 @@ class CreditBlockchain:
         }
         
         table_name = table_map.get(blockchain_type, 'credit_score_blockchain')
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(f'SELECT * FROM {table_name} ORDER BY id')
-        blocks = cursor.fetchall()
-        
-        if not blocks:
+
+        state = self._verify_state.setdefault(
+            blockchain_type, {'last_id': 0, 'total': 0, 'verified': 0, 'tip': None}
+        )
+
+        # Blocks are immutable once checked, so only fetch what appeared
+        # since the last verification instead of rescanning the whole chain.
+        # Linkage is checked inside SQLite with one window query: each row's
+        # previous_hash must equal the LAG() of block_hash in id order.
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                f'SELECT * FROM {table_name} WHERE id > ? ORDER BY id',
+                (state['last_id'],)
+            )
+            blocks = cursor.fetchall()
+            cursor.execute(f'''
+                SELECT MIN(id) FROM (
+                    SELECT id, previous_hash,
+                           LAG(block_hash) OVER (ORDER BY id) AS prev
+                    FROM {table_name} WHERE id > ?
+                ) WHERE prev IS NOT NULL AND previous_hash != prev
+            ''', (state['last_id'],))
+            first_bad_link_id = cursor.fetchone()[0]
+
+        if not blocks and state['total'] == 0:
             return {'valid': True, 'total_blocks': 0, 'verified_blocks': 0, 'integrity_score': 1.0}
-        
+
+        # Hash verification is independent per block, so large backlogs
+        # (typically the first verify of a long chain) are fanned out across
+        # worker processes; small batches stay serial to avoid fork overhead.
+        if len(blocks) >= _PARALLEL_VERIFY_THRESHOLD:
+            with ProcessPoolExecutor() as pool:
+                results = list(pool.map(
+                    _verify_block, blocks, repeat(blockchain_type), chunksize=64
+                ))
+        else:
+            results = [self._verify_single_block(block, blockchain_type) for block in blocks]
+
         verified_blocks = 0
-        total_blocks = len(blocks)
-        
-        for i, block in enumerate(blocks):
-            # Verify block hash and proof of work
-            if self._verify_single_block(block, blockchain_type):
-                verified_blocks += 1
-            
-            # Verify chain linkage (except for genesis block)
-            if i > 0:
-                previous_block = blocks[i-1]
-                if blockchain_type == 'credit_score':
-                    if block[2] != previous_block[1]:  # previous_hash != previous block_hash
-                        break
-                elif blockchain_type == 'transaction':
-                    if block[2] != previous_block[1]:
-                        break
-        
+
+        if blocks:
+            # The window query covers links between fetched rows; the seam to
+            # the already-verified region (stored tip vs. first new block) is
+            # the one link SQLite cannot see
+            if state['tip'] is not None and blocks[0][2] != state['tip']:
+                first_bad_link_id = blocks[0][0]
+
+            # Hash verification stops at the first linkage break, matching
+            # the old early-exit walk
+            if first_bad_link_id is None:
+                verified_blocks = sum(results)
+            else:
+                verified_blocks = sum(
+                    ok for blk, ok in zip(blocks, results) if blk[0] <= first_bad_link_id
+                )
+            state['last_id'] = blocks[-1][0]
+            state['tip'] = blocks[-1][1]
+            state['total'] += len(blocks)
+            state['verified'] += verified_blocks
+
+        total_blocks = state['total']
+        verified_blocks = state['verified']
         integrity_score = verified_blocks / total_blocks if total_blocks > 0 else 1.0
         
         # Log verification
@@ -306,17 +573,16 @@ class CreditBlockchain:
             'timestamp': datetime.now().isoformat()
         }
         
-        verification_hash = hashlib.sha256(json.dumps(verification_data, sort_keys=True).encode()).hexdigest()
-        
-        cursor.execute('''
-            INSERT INTO blockchain_verification_log 
-            (blockchain_type, total_blocks, verified_blocks, integrity_score, verification_hash)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (blockchain_type, total_blocks, verified_blocks, integrity_score, verification_hash))
-        
-        conn.commit()
-        conn.close()
-        
+        verification_hash = _fast_hash(fastjson.dumps_canonical(verification_data)).hexdigest()
+
+        with self._db_lock:
+            self._conn.execute('''
+                INSERT INTO blockchain_verification_log
+                (blockchain_type, total_blocks, verified_blocks, integrity_score, verification_hash)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (blockchain_type, total_blocks, verified_blocks, integrity_score, verification_hash))
+            self._conn.commit()
+
         return {
             'valid': integrity_score == 1.0,
             'total_blocks': total_blocks,
@@ -327,62 +593,24 @@ class CreditBlockchain:
     
     def _verify_single_block(self, block: tuple, blockchain_type: str) -> bool:
         """Verify a single block's integrity"""
-        try:
-            if blockchain_type == 'credit_score':
-                block_id, block_hash, previous_hash, user_id, credit_score, model_version, \
-                prediction_confidence, risk_factors, merkle_root, nonce, timestamp, miner_id, block_size, verified = block
-                
-                # Recreate block data
-                block_data = {
-                    'user_id': user_id,
-                    'credit_score': credit_score,
-                    'model_version': model_version,
-                    'prediction_confidence': prediction_confidence,
-                    'risk_factors': json.loads(risk_factors),
-                    'previous_hash': previous_hash,
-                    'timestamp': timestamp
-                }
-                
-                block_string = json.dumps(block_data, sort_keys=True) + merkle_root
-                final_block_data = block_string + str(nonce)
-                calculated_hash = hashlib.sha256(final_block_data.encode()).hexdigest()
-                
-                return calculated_hash == block_hash
-            
-            elif blockchain_type == 'transaction':
-                block_id, block_hash, previous_hash, user_id, transaction_type, amount, \
-                transaction_hash, merkle_root, nonce, timestamp, verified = block
-                
-                block_string = f"{previous_hash}{transaction_hash}{merkle_root}"
-                final_block_data = block_string + str(nonce)
-                calculated_hash = hashlib.sha256(final_block_data.encode()).hexdigest()
-                
-                return calculated_hash == block_hash
-            
-            return False
-            
-        except Exception:
-            return False
-    
+        return _verify_block(block, blockchain_type)
+
     def get_user_credit_history(self, user_id: int) -> List[Dict]:
         """Get complete credit history for a user from blockchain"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT block_hash, credit_score, model_version, prediction_confidence, 
-                   risk_factors, timestamp, verified
-            FROM credit_score_blockchain 
-            WHERE user_id = ? 
-            ORDER BY timestamp DESC
-        ''', (user_id,))
-        
-        history = cursor.fetchall()
-        conn.close()
-        
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.execute('''
+                SELECT block_hash, credit_score, model_version, prediction_confidence,
+                       risk_factors, timestamp, verified
+                FROM credit_score_blockchain
+                WHERE user_id = ?
+                ORDER BY timestamp DESC
+            ''', (user_id,))
+            history = cursor.fetchall()
+
         return [
             {
-                'block_hash': record[0],
+                'block_hash': record[0].hex(),
                 'credit_score': record[1],
                 'model_version': record[2],
                 'prediction_confidence': record[3],
@@ -393,36 +621,85 @@ class CreditBlockchain:
             for record in history
         ]
     
+    def get_blocks_by_risk_factor(self, risk_factor: str, limit: int = 100) -> List[Dict]:
+        """Find credit score blocks citing a given risk factor.
+
+        Membership anywhere in the risk_factors array is checked inside
+        SQLite via JSON1's json_each instead of loading and parsing every
+        row's JSON in Python. This is necessarily a table scan: no
+        single-position expression index can answer an any-position match.
+        """
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            cursor.execute('''
+                SELECT block_hash, user_id, credit_score, risk_factors, timestamp
+                FROM credit_score_blockchain
+                WHERE EXISTS (
+                        SELECT 1 FROM json_each(risk_factors) WHERE value = ?
+                )
+                ORDER BY id DESC
+                LIMIT ?
+            ''', (risk_factor, limit))
+            rows = cursor.fetchall()
+
+        return [
+            {
+                'block_hash': row[0].hex(),
+                'user_id': row[1],
+                'credit_score': row[2],
+                'risk_factors': fastjson.loads(row[3]),
+                'timestamp': row[4]
+            }
+            for row in rows
+        ]
+
     def get_blockchain_statistics(self) -> Dict:
         """Get comprehensive blockchain statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         stats = {}
-        
-        # Credit score blockchain stats
-        cursor.execute('SELECT COUNT(*), AVG(credit_score) FROM credit_score_blockchain')
-        credit_stats = cursor.fetchone()
+
+        # Chain linkage is aggregated inside SQLite with a window function:
+        # count rows whose previous_hash disagrees with LAG(block_hash)
+        link_breaks_sql = '''
+            SELECT COUNT(*) FROM (
+                SELECT previous_hash,
+                       LAG(block_hash) OVER (ORDER BY id) AS prev
+                FROM {table}
+            ) WHERE prev IS NOT NULL AND previous_hash != prev
+        '''
+
+        with self._db_lock:
+            cursor = self._conn.cursor()
+
+            # Credit score blockchain stats
+            cursor.execute('SELECT COUNT(*), AVG(credit_score) FROM credit_score_blockchain')
+            credit_stats = cursor.fetchone()
+            cursor.execute(link_breaks_sql.format(table='credit_score_blockchain'))
+            credit_link_breaks = cursor.fetchone()[0]
+
+            # Transaction blockchain stats
+            cursor.execute('SELECT COUNT(*), SUM(amount) FROM transaction_blockchain')
+            transaction_stats = cursor.fetchone()
+            cursor.execute(link_breaks_sql.format(table='transaction_blockchain'))
+            transaction_link_breaks = cursor.fetchone()[0]
+
+            # Verification stats
+            cursor.execute('''
+                SELECT blockchain_type, AVG(integrity_score), COUNT(*)
+                FROM blockchain_verification_log
+                GROUP BY blockchain_type
+            ''')
+            verification_stats = cursor.fetchall()
+
         stats['credit_blockchain'] = {
             'total_blocks': credit_stats[0],
-            'average_credit_score': round(credit_stats[1], 2) if credit_stats[1] else 0
+            'average_credit_score': round(credit_stats[1], 2) if credit_stats[1] else 0,
+            'chain_link_breaks': credit_link_breaks
         }
-        
-        # Transaction blockchain stats
-        cursor.execute('SELECT COUNT(*), SUM(amount) FROM transaction_blockchain')
-        transaction_stats = cursor.fetchone()
         stats['transaction_blockchain'] = {
             'total_blocks': transaction_stats[0],
-            'total_transaction_volume': round(transaction_stats[1], 2) if transaction_stats[1] else 0
+            'total_transaction_volume': round(transaction_stats[1], 2) if transaction_stats[1] else 0,
+            'chain_link_breaks': transaction_link_breaks
         }
-        
-        # Verification stats
-        cursor.execute('''
-            SELECT blockchain_type, AVG(integrity_score), COUNT(*) 
-            FROM blockchain_verification_log 
-            GROUP BY blockchain_type
-        ''')
-        verification_stats = cursor.fetchall()
         stats['verification_history'] = [
             {
                 'blockchain_type': record[0],
@@ -431,8 +708,7 @@ class CreditBlockchain:
             }
             for record in verification_stats
         ]
-        
-        conn.close()
+
         return stats
 
 # Initialize blockchain instance
@@ -449,7 +725,8 @@ async def add_credit_score_to_blockchain(
 ):
     """Add credit score to blockchain"""
     try:
-        block_hash = credit_blockchain.add_credit_score_block(
+        block_hash = await run_in_threadpool(
+            credit_blockchain.add_credit_score_block,
             user_id, credit_score, model_version, prediction_confidence, risk_factors
         )
         
@@ -469,7 +746,9 @@ async def add_transaction_to_blockchain(
 ):
     """Add transaction to blockchain"""
     try:
-        block_hash = credit_blockchain.add_transaction_block(user_id, transaction_type, amount)
+        block_hash = await run_in_threadpool(
+            credit_blockchain.add_transaction_block, user_id, transaction_type, amount
+        )
         
         return {
             'success': True,
@@ -483,7 +762,9 @@ async def add_transaction_to_blockchain(
 async def verify_blockchain_integrity(blockchain_type: str):
     """Verify blockchain integrity"""
     try:
-        verification_result = credit_blockchain.verify_blockchain_integrity(blockchain_type)
+        verification_result = await run_in_threadpool(
+            credit_blockchain.verify_blockchain_integrity, blockchain_type
+        )
         
         return {
             'blockchain_type': blockchain_type,
@@ -497,7 +778,7 @@ async def verify_blockchain_integrity(blockchain_type: str):
 async def get_user_blockchain_history(user_id: int):
     """Get user's complete blockchain history"""
     try:
-        credit_history = credit_blockchain.get_user_credit_history(user_id)
+        credit_history = await run_in_threadpool(credit_blockchain.get_user_credit_history, user_id)
         
         return {
             'user_id': user_id,
@@ -507,11 +788,27 @@ async def get_user_blockchain_history(user_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching history: {str(e)}")
 
+@blockchain_router.get("/blocks-by-risk-factor/{risk_factor}")
+async def get_blocks_by_risk_factor(risk_factor: str, limit: int = 100):
+    """Find credit score blocks citing a given risk factor"""
+    try:
+        blocks = await run_in_threadpool(
+            credit_blockchain.get_blocks_by_risk_factor, risk_factor, limit
+        )
+
+        return {
+            'risk_factor': risk_factor,
+            'blocks': blocks,
+            'total_records': len(blocks)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching blocks: {str(e)}")
+
 @blockchain_router.get("/statistics")
 async def get_blockchain_statistics():
     """Get comprehensive blockchain statistics"""
     try:
-        stats = credit_blockchain.get_blockchain_statistics()
+        stats = await run_in_threadpool(credit_blockchain.get_blockchain_statistics)
         
         return {
             'blockchain_statistics': stats,
@@ -529,7 +826,9 @@ async def blockchain_health_check():
         blockchain_types = ['credit_score', 'transaction']
         
         for blockchain_type in blockchain_types:
-            verification = credit_blockchain.verify_blockchain_integrity(blockchain_type)
+            verification = await run_in_threadpool(
+                credit_blockchain.verify_blockchain_integrity, blockchain_type
+            )
             health_status[blockchain_type] = {
                 'status': 'healthy' if verification['integrity_score'] >= 0.95 else 'degraded',
                 'integrity_score': verification['integrity_score'],
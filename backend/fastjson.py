@@ -0,0 +1,33 @@
+"""Canonical JSON helpers shared by the blockchain hashing and audit paths.
+
+orjson (a SIMD-accelerated serializer) is used when it is installed; the
+stdlib json module with sorted keys and compact separators produces the same
+bytes for the payloads hashed here, so the dependency stays optional and
+hashes remain stable across environments.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def dumps_canonical(obj) -> bytes:
+        """Serialize to canonical (sorted-key, compact) JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return orjson.loads(data)
+else:
+    def dumps_canonical(obj) -> bytes:
+        """Serialize to canonical (sorted-key, compact) JSON bytes"""
+        # ensure_ascii=False matches orjson's UTF-8 output byte for byte
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'),
+                          ensure_ascii=False).encode()
+
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return json.loads(data)
@@ -1,14 +1,36 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
+import asyncio
 import hashlib
-import json
+import io
+import ssl
 from datetime import datetime
+
+import fastjson
+import numpy as np
 from typing import Dict, List, Optional
 import sqlite3
+import struct
+import threading
+import time
+from collections import deque
+
+# The scoring kernel is JIT-compiled when numba is installed; the identical
+# plain-Python function runs otherwise.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Dict-returning endpoints are encoded by orjson when it is installed;
+# fastjson already tracks whether orjson imported
+_RESPONSE_CLASS = JSONResponse if fastjson.orjson is None else ORJSONResponse
 
 # Simple Blockchain Demo without TensorFlow dependencies
-app = FastAPI(title="Blockchain Credit Risk Demo")
+app = FastAPI(title="Blockchain Credit Risk Demo",
+              default_response_class=_RESPONSE_CLASS)
 
 # CORS middleware
 app.add_middleware(
@@ -25,156 +47,292 @@ class CreditScoreRequest(BaseModel):
     existing_debt: float
     requested_amount: float
 
+class BatchCreditScoreRequest(BaseModel):
+    user_ids: List[int]
+    monthly_incomes: List[float]
+    existing_debts: List[float]
+    requested_amounts: List[float]
+
+# Hot-path SQL kept as a single constant: sqlite3's per-connection statement
+# cache keys on the exact string, so the parser/planner runs once
+_INSERT_SQL = '''
+    INSERT INTO credit_blocks (block_hash, previous_hash, user_id, credit_score, prediction_data, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+
+def _pack_preimage(user_id: int, credit_score: int, prev_hash: bytes,
+                   timestamp: str, pred_bytes: bytes) -> bytes:
+    """Fixed-layout binary hash preimage for a credit block.
+
+    The block schema is small and fixed, so the outer JSON envelope (and
+    its key sorting and float formatting) is replaced with a straight byte
+    concatenation: packed integers, the raw previous hash, the ISO
+    timestamp, and the canonical prediction bytes.
+    """
+    return (struct.pack('<qi', user_id, credit_score)
+            + prev_hash
+            + timestamp.encode()
+            + pred_bytes)
+
+
+# 32-byte sentinel standing in for the previous hash of the first block
+_GENESIS_HASH = b"\x00" * 32
+
+# Timestamps are second-precision, so the formatted string is cached per
+# second instead of allocating and formatting a datetime per request
+_now_cache = (0, '')
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, cached per second"""
+    global _now_cache
+    t = int(time.time())
+    if _now_cache[0] != t:
+        _now_cache = (t, datetime.fromtimestamp(t).isoformat())
+    return _now_cache[1]
+
+# Pending writes are coalesced and checkpointed to SQLite in one transaction
+# once this many blocks accumulate (or after this many seconds, or on
+# shutdown), turning N fsyncs under bursty traffic into one
+_FLUSH_EVERY = 64
+_CHECKPOINT_SECONDS = 5.0
+
+
 class SimpleBlockchain:
     """Simple blockchain implementation for credit scoring demo"""
     
     def __init__(self):
         self.db_path = 'simple_blockchain.db'
+        # FastAPI runs sync handlers in a threadpool, so connections are
+        # pooled per thread instead of opened and closed per call
+        self._local = threading.local()
         self._init_db()
-    
+
+    def _conn(self) -> sqlite3.Connection:
+        """Long-lived per-thread connection with the WAL pragmas applied"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=256)
+            cursor = conn.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA busy_timeout=5000')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA cache_size=-20000')
+            self._local.conn = conn
+        return conn
+
     def _init_db(self):
         """Initialize simple blockchain database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
-        
+
+        # Chain verification already guarantees hash uniqueness and nothing
+        # looks rows up by hash, so block_hash carries no UNIQUE constraint:
+        # that implicit index would be rebalanced on every insert for no
+        # read benefit. Databases from older builds are rebuilt without it.
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='credit_blocks'")
+        existing = cursor.fetchone()
+        migrate = existing is not None and 'UNIQUE' in existing[0]
+        if migrate:
+            cursor.execute('ALTER TABLE credit_blocks RENAME TO credit_blocks_old')
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS credit_blocks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                block_hash TEXT UNIQUE NOT NULL,
-                previous_hash TEXT NOT NULL,
+                block_hash BLOB NOT NULL,
+                previous_hash BLOB NOT NULL,
                 user_id INTEGER NOT NULL,
                 credit_score INTEGER NOT NULL,
-                prediction_data TEXT NOT NULL,
+                prediction_data BLOB NOT NULL,
                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
                 verified BOOLEAN DEFAULT TRUE
             )
         ''')
-        
+
+        if migrate:
+            # Rows from before the BLOB switch carry hex TEXT hashes and
+            # TEXT prediction JSON; translate them during the copy so the
+            # in-memory chain and _pack_preimage only ever see bytes
+            rows = cursor.execute('''
+                SELECT id, block_hash, previous_hash, user_id, credit_score,
+                       prediction_data, timestamp, verified
+                FROM credit_blocks_old ORDER BY id
+            ''').fetchall()
+            cursor.executemany(
+                'INSERT INTO credit_blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(row_id,
+                  bytes.fromhex(bh) if isinstance(bh, str) else bh,
+                  bytes.fromhex(ph) if isinstance(ph, str) else ph,
+                  user_id, credit_score,
+                  pred.encode() if isinstance(pred, str) else pred,
+                  timestamp, verified)
+                 for (row_id, bh, ph, user_id, credit_score,
+                      pred, timestamp, verified) in rows])
+            cursor.execute('DROP TABLE credit_blocks_old')
+
+        # get_user_history filters on user_id and sorts by timestamp; this
+        # index serves both instead of a full scan plus sort per call
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_credit_blocks_user_ts
+            ON credit_blocks(user_id, timestamp DESC)
+        ''')
+
         conn.commit()
-        conn.close()
-    
+
+        # The workload is write-mostly and read-rarely, so the chain lives
+        # in process memory (row tuples plus a per-user index) and SQLite
+        # acts as the durable checkpoint; existing rows are loaded once here
+        self._blocks_mem = []
+        self._user_idx = {}
+        self._score_sum = 0
+        cursor.execute('''
+            SELECT block_hash, previous_hash, user_id, credit_score,
+                   prediction_data, timestamp
+            FROM credit_blocks ORDER BY id
+        ''')
+        for row in cursor:
+            self._index_mem(row)
+
+        # Chain tip cached in memory; writes are serialized by _write_lock,
+        # so inserts skip the SELECT-per-call tip lookup
+        self._last_hash = self._blocks_mem[-1][0] if self._blocks_mem else _GENESIS_HASH
+        self._write_lock = threading.Lock()
+        self._pending = deque()
+        # Verification progress: blocks are immutable once checked, so each
+        # verify call only hashes blocks past the cached position
+        self._verify_cache = {'pos': 0, 'verified': 0,
+                              'tip': None, 'broken': False}
+
+    def _index_mem(self, row: tuple):
+        """Append a block row to the in-memory chain and the user index"""
+        self._user_idx.setdefault(row[2], []).append(len(self._blocks_mem))
+        self._blocks_mem.append(row)
+        self._score_sum += row[3]
+
     def add_credit_block(self, user_id: int, credit_score: int, prediction_data: dict) -> str:
         """Add credit score to blockchain"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get previous block hash
-        cursor.execute('SELECT block_hash FROM credit_blocks ORDER BY id DESC LIMIT 1')
-        result = cursor.fetchone()
-        previous_hash = result[0] if result else "0" * 64
-        
-        # Create block data
-        block_data = {
-            'user_id': user_id,
-            'credit_score': credit_score,
-            'prediction_data': prediction_data,
-            'previous_hash': previous_hash,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Generate block hash
-        block_string = json.dumps(block_data, sort_keys=True)
-        block_hash = hashlib.sha256(block_string.encode()).hexdigest()
-        
-        # Insert block
-        cursor.execute('''
-            INSERT INTO credit_blocks (block_hash, previous_hash, user_id, credit_score, prediction_data)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (block_hash, previous_hash, user_id, credit_score, json.dumps(prediction_data)))
-        
-        conn.commit()
-        conn.close()
-        
-        return block_hash
+        with self._write_lock:
+            previous_hash = self._last_hash
+            timestamp = _now_iso()
+
+            # Serialize the prediction once; the same bytes feed the hash
+            # and land in the row
+            pred_bytes = fastjson.dumps_canonical(prediction_data)
+            block_hash = hashlib.sha256(_pack_preimage(
+                user_id, credit_score, previous_hash, timestamp,
+                pred_bytes)).digest()
+
+            # The hash is needed for the response now; the row goes into
+            # the in-memory chain immediately and joins the next checkpoint
+            row = (block_hash, previous_hash, user_id, credit_score,
+                   pred_bytes, timestamp)
+            self._index_mem(row)
+            self._pending.append(row)
+            self._last_hash = block_hash
+
+            if len(self._pending) >= _FLUSH_EVERY:
+                self._flush_locked()
+
+        # API responses keep the familiar hex form; storage stays binary
+        return block_hash.hex()
+
+    def _flush_locked(self):
+        """Write pending blocks in one transaction; caller holds _write_lock"""
+        if not self._pending:
+            return
+        rows = list(self._pending)
+        self._pending.clear()
+        conn = self._conn()
+        with conn:
+            conn.executemany(_INSERT_SQL, rows)
+
+    def flush(self):
+        """Checkpoint pending blocks to SQLite; reads never wait on this"""
+        with self._write_lock:
+            self._flush_locked()
+
+    async def _checkpoint_loop(self):
+        """Background task bounding data loss to a few seconds of blocks"""
+        while True:
+            await asyncio.sleep(_CHECKPOINT_SECONDS)
+            self.flush()
     
     def verify_blockchain(self) -> dict:
         """Verify blockchain integrity"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM credit_blocks ORDER BY id')
-        blocks = cursor.fetchall()
-        conn.close()
-        
-        if not blocks:
+        cache = self._verify_cache
+        blocks = self._blocks_mem
+
+        # The list only ever grows, so reading its length is a safe
+        # snapshot; everything below it is immutable
+        total = len(blocks)
+        if total == 0:
             return {'valid': True, 'total_blocks': 0, 'verified_blocks': 0, 'integrity_score': 1.0}
-        
-        verified_blocks = 0
-        total_blocks = len(blocks)
-        
-        for i, block in enumerate(blocks):
-            block_id, block_hash, previous_hash, user_id, credit_score, prediction_data, timestamp, verified = block
-            
-            # Recreate block data
-            block_data = {
-                'user_id': user_id,
-                'credit_score': credit_score,
-                'prediction_data': json.loads(prediction_data),
-                'previous_hash': previous_hash,
-                'timestamp': timestamp
-            }
-            
-            # Verify hash
-            block_string = json.dumps(block_data, sort_keys=True)
-            calculated_hash = hashlib.sha256(block_string.encode()).hexdigest()
-            
+
+        # Walk only the tail appended since the last call; linkage needs
+        # just the previous block's hash, carried over in the cache
+        for i in range(cache['pos'], total):
+            block_hash, previous_hash, user_id, credit_score, pred_bytes, timestamp = blocks[i]
+            # Rebuild the packed preimage straight from the stored
+            # columns; no JSON parse/re-serialize round trip is needed
+            calculated_hash = hashlib.sha256(_pack_preimage(
+                user_id, credit_score, previous_hash, timestamp,
+                pred_bytes)).digest()
+
             if calculated_hash == block_hash:
-                verified_blocks += 1
-            
+                cache['verified'] += 1
+
             # Verify chain linkage
-            if i > 0:
-                previous_block = blocks[i-1]
-                if previous_hash != previous_block[1]:
-                    break
-        
-        integrity_score = verified_blocks / total_blocks if total_blocks > 0 else 1.0
-        
+            if cache['tip'] is not None and previous_hash != cache['tip']:
+                cache['broken'] = True
+            cache['tip'] = block_hash
+        cache['pos'] = total
+
+        integrity_score = cache['verified'] / total
+
         return {
-            'valid': integrity_score == 1.0,
-            'total_blocks': total_blocks,
-            'verified_blocks': verified_blocks,
+            'valid': integrity_score == 1.0 and not cache['broken'],
+            'total_blocks': total,
+            'verified_blocks': cache['verified'],
             'integrity_score': integrity_score
         }
     
-    def get_user_history(self, user_id: int) -> List[dict]:
-        """Get user's blockchain credit history"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT block_hash, credit_score, prediction_data, timestamp
-            FROM credit_blocks 
-            WHERE user_id = ? 
-            ORDER BY timestamp DESC
-        ''', (user_id,))
-        
-        history = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'block_hash': record[0],
-                'credit_score': record[1],
-                'prediction_data': json.loads(record[2]),
-                'timestamp': record[3]
-            }
-            for record in history
-        ]
+    def get_user_history_json(self, user_id: int) -> bytes:
+        """Get user's blockchain credit history as a JSON response body.
+
+        The stored prediction bytes are already canonical JSON, so each row
+        is spliced into the body verbatim instead of being parsed and
+        re-encoded just for FastAPI to serialize again. Rows come from the
+        in-memory user index, newest first.
+        """
+        indices = self._user_idx.get(user_id, [])
+
+        buf = io.BytesIO()
+        buf.write(b'{"user_id":%d,"credit_history":[' % user_id)
+        total = 0
+        for i in reversed(indices):
+            block_hash, _, _, credit_score, pred_bytes, timestamp = self._blocks_mem[i]
+            if total:
+                buf.write(b',')
+            buf.write(b'{"block_hash":"%s","credit_score":%d,'
+                      b'"prediction_data":%s,"timestamp":"%s"}'
+                      % (block_hash.hex().encode(), credit_score,
+                         pred_bytes, timestamp.encode()))
+            total += 1
+        buf.write(b'],"total_records":%d}' % total)
+        return buf.getvalue()
     
     def get_statistics(self) -> dict:
         """Get blockchain statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*), AVG(credit_score) FROM credit_blocks')
-        stats = cursor.fetchone()
-        
-        conn.close()
-        
+        total = len(self._blocks_mem)
+
         return {
             'credit_blockchain': {
-                'total_blocks': stats[0],
-                'average_credit_score': round(stats[1], 2) if stats[1] else 0
+                'total_blocks': total,
+                'average_credit_score': round(self._score_sum / total, 2) if total else 0
             },
             'transaction_blockchain': {
                 'total_blocks': 0,
@@ -186,10 +344,46 @@ class SimpleBlockchain:
 # Initialize blockchain
 blockchain = SimpleBlockchain()
 
-def calculate_simple_credit_score(monthly_income: float, existing_debt: float, requested_amount: float) -> dict:
-    """Simple credit scoring algorithm"""
+
+@app.on_event("startup")
+async def log_hash_backend():
+    """Log the OpenSSL build so slow SHA-256 backends are visible.
+
+    hashlib dispatches SHA-256 to OpenSSL, which uses the CPU's SHA
+    extensions only when compiled with them — worth checking if block
+    hashing throughput disappoints.
+    """
+    print(f"🔒 SHA-256 via {ssl.OPENSSL_VERSION} "
+          f"(guaranteed algorithms: {len(hashlib.algorithms_guaranteed)})")
+
+
+@app.on_event("startup")
+async def start_checkpoint_loop():
+    """Persist coalesced blocks to SQLite in the background"""
+    # The event loop holds only a weak reference to tasks; keep a strong
+    # one on app.state so the checkpoint loop can't be garbage-collected
+    app.state.checkpoint_task = asyncio.create_task(blockchain._checkpoint_loop())
+
+
+@app.on_event("shutdown")
+async def flush_on_shutdown():
+    """Persist any coalesced blocks before the process exits"""
+    blockchain.flush()
+
+# Decision / risk labels indexed by the kernel's category code
+_DECISIONS = ("Approve", "Approve", "Review", "Reject")
+_RISK_CATEGORIES = ("Excellent", "Good", "Fair", "Poor")
+
+
+def _score_kernel(monthly_income: float, existing_debt: float, requested_amount: float):
+    """Numeric core of the scoring algorithm.
+
+    Returns (credit_score, category_code, max_loan, interest_rate) as plain
+    numbers so numba can compile it; the string labels are looked up by the
+    wrapper.
+    """
     score = 500  # Base score
-    
+
     # Income factor
     if monthly_income >= 50000:
         score += 150
@@ -197,43 +391,88 @@ def calculate_simple_credit_score(monthly_income: float, existing_debt: float, r
         score += 100
     elif monthly_income >= 15000:
         score += 50
-    
+
     # Debt factor
-    debt_ratio = existing_debt / monthly_income if monthly_income > 0 else 1
+    debt_ratio = existing_debt / monthly_income if monthly_income > 0 else 1.0
     if debt_ratio < 0.3:
         score += 100
     elif debt_ratio < 0.6:
         score += 50
     else:
         score -= 50
-    
+
     # Amount factor
     if requested_amount <= 50000:
         score += 50
     elif requested_amount <= 100000:
         score += 25
-    
-    # Determine decision
+
+    # Determine decision category
     if score >= 700:
-        decision = "Approve"
-        risk_category = "Excellent"
+        category = 0
     elif score >= 600:
-        decision = "Approve"
-        risk_category = "Good"
+        category = 1
     elif score >= 500:
-        decision = "Review"
-        risk_category = "Fair"
+        category = 2
     else:
-        decision = "Reject"
-        risk_category = "Poor"
-    
-    max_loan = min(125000, monthly_income * 10)
-    interest_rate = max(12, min(24, 24 - (score - 300) / 600 * 12))
-    
+        category = 3
+
+    # Clamp tail as conditional expressions: no builtin min/max dispatch
+    # per call, and the JIT lowers them to machine min/max instructions
+    loan_cap = monthly_income * 10.0
+    max_loan = 125000.0 if loan_cap > 125000.0 else loan_cap
+    rate = 24.0 - (score - 300) / 600.0 * 12.0
+    interest_rate = 12.0 if rate < 12.0 else (24.0 if rate > 24.0 else rate)
+
+    return max(300, min(900, score)), category, max_loan, interest_rate
+
+
+if njit is not None:
+    _score_kernel = njit(cache=True)(_score_kernel)
+# Warm up so a JIT compile doesn't land on the first request
+_score_kernel(0.0, 0.0, 0.0)
+
+
+def score_batch(monthly_income: np.ndarray, existing_debt: np.ndarray,
+                requested_amount: np.ndarray) -> Dict[str, np.ndarray]:
+    """Vectorized counterpart of _score_kernel for whole batches.
+
+    Columns in, columns out: one NumPy pass over the arrays replaces a
+    Python-level loop through the scalar kernel.
+    """
+    score = 500 + np.select(
+        [monthly_income >= 50000, monthly_income >= 25000, monthly_income >= 15000],
+        [150, 100, 50], default=0)
+
+    debt_ratio = np.divide(existing_debt, monthly_income,
+                           out=np.ones_like(existing_debt, dtype=np.float64),
+                           where=monthly_income > 0)
+    score = score + np.where(debt_ratio < 0.3, 100,
+                             np.where(debt_ratio < 0.6, 50, -50))
+    score = score + np.where(requested_amount <= 50000, 50,
+                             np.where(requested_amount <= 100000, 25, 0))
+
+    category = np.select([score >= 700, score >= 600, score >= 500],
+                         [0, 1, 2], default=3)
+
     return {
-        'credit_score': max(300, min(900, score)),
-        'decision': decision,
-        'risk_category': risk_category,
+        'credit_score': np.clip(score, 300, 900),
+        'category': category,
+        'max_loan_amount': np.minimum(125000.0, monthly_income * 10.0),
+        'recommended_interest_rate': np.clip(
+            24.0 - (score - 300) / 600.0 * 12.0, 12.0, 24.0),
+    }
+
+
+def calculate_simple_credit_score(monthly_income: float, existing_debt: float, requested_amount: float) -> dict:
+    """Simple credit scoring algorithm"""
+    credit_score, category, max_loan, interest_rate = _score_kernel(
+        monthly_income, existing_debt, requested_amount)
+
+    return {
+        'credit_score': credit_score,
+        'decision': _DECISIONS[category],
+        'risk_category': _RISK_CATEGORIES[category],
         'max_loan_amount': int(max_loan),
         'recommended_interest_rate': round(interest_rate, 2),
         'model_confidence': 0.85,
@@ -271,6 +510,51 @@ async def enhanced_prediction(request: CreditScoreRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
+@app.post("/api/ml/enhanced-prediction/batch")
+async def enhanced_prediction_batch(request: BatchCreditScoreRequest):
+    """Make blockchain-verified credit predictions for a batch of applicants"""
+    n = len(request.user_ids)
+    if not (n == len(request.monthly_incomes)
+            == len(request.existing_debts) == len(request.requested_amounts)):
+        raise HTTPException(status_code=422, detail="All input arrays must have the same length")
+
+    try:
+        # One vectorized pass over the whole batch
+        scored = score_batch(
+            np.asarray(request.monthly_incomes, dtype=np.float64),
+            np.asarray(request.existing_debts, dtype=np.float64),
+            np.asarray(request.requested_amounts, dtype=np.float64)
+        )
+
+        predictions = []
+        for i in range(n):
+            category = int(scored['category'][i])
+            prediction = {
+                'credit_score': int(scored['credit_score'][i]),
+                'decision': _DECISIONS[category],
+                'risk_category': _RISK_CATEGORIES[category],
+                'max_loan_amount': int(scored['max_loan_amount'][i]),
+                'recommended_interest_rate': round(float(scored['recommended_interest_rate'][i]), 2),
+                'model_confidence': 0.85,
+                'blockchain_verified': True
+            }
+            prediction['blockchain_hash'] = blockchain.add_credit_block(
+                request.user_ids[i], prediction['credit_score'], prediction)
+            predictions.append(prediction)
+
+        # Materialize the whole batch in one executemany transaction
+        blockchain.flush()
+
+        return {
+            'success': True,
+            'predictions': predictions,
+            'model_accuracy': 0.85,
+            'blockchain_verified': True
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
+
 @app.get("/api/ml/model-accuracy")
 async def get_model_accuracy():
     """Get model accuracy and blockchain status"""
@@ -291,7 +575,7 @@ async def get_blockchain_statistics():
     stats = blockchain.get_statistics()
     return {
         'blockchain_statistics': stats,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _now_iso()
     }
 
 @app.get("/api/blockchain/verify-integrity/credit_score")
@@ -301,18 +585,14 @@ async def verify_blockchain_integrity():
     return {
         'blockchain_type': 'credit_score',
         'verification_result': verification,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _now_iso()
     }
 
 @app.get("/api/blockchain/user-history/{user_id}")
 async def get_user_history(user_id: int):
     """Get user's blockchain history"""
-    history = blockchain.get_user_history(user_id)
-    return {
-        'user_id': user_id,
-        'credit_history': history,
-        'total_records': len(history)
-    }
+    return Response(content=blockchain.get_user_history_json(user_id),
+                    media_type="application/json")
 
 @app.get("/api/blockchain/health")
 async def blockchain_health():
@@ -328,7 +608,7 @@ async def blockchain_health():
                 'total_blocks': verification['total_blocks']
             }
         },
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _now_iso()
     }
 
 @app.get("/")
@@ -341,4 +621,13 @@ if __name__ == "__main__":
     print("📊 Frontend: http://localhost:3000")
     print("🔗 Blockchain Dashboard: http://localhost:3000/blockchain")
     print("📖 API Docs: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools are optional accelerators (C event loop and HTTP
+    # parser); uvicorn's defaults are used when they are not installed.
+    # Workers stays at 1: the chain tip is cached in process memory, so the
+    # blockchain needs a single writer.
+    try:
+        import uvloop, httptools  # noqa: F401
+        extra = {'loop': 'uvloop', 'http': 'httptools'}
+    except ImportError:
+        extra = {}
+    uvicorn.run(app, host="0.0.0.0", port=8000, **extra)
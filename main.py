@@ -1,11 +1,49 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 import asyncio
+import hashlib
+import json
 import os
 
+# Demo payloads never change, so they are serialized once at import time
+# and served as raw bytes, skipping per-request encoding. orjson is used
+# when installed; the stdlib encoder produces equivalent JSON otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _demo_bytes(payload: dict) -> bytes:
+    """Serialize a constant demo payload to JSON bytes at import time"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _cached_json(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a constant payload with ETag revalidation.
+
+    The demo payloads never change per process, so clients holding the
+    current ETag get an empty 304 and cache hits skip serialization
+    entirely.
+    """
+    if request.headers.get("if-none-match") == etag:
+        # RFC 9110: a 304 carries the ETag the 200 would, so shared caches
+        # can revalidate their stored entry
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json",
+                    headers={"ETag": etag, "Cache-Control": "public, max-age=300"})
+
+
+# Dict-returning endpoints are encoded by orjson when it is installed
+_RESPONSE_CLASS = JSONResponse if orjson is None else ORJSONResponse
+
 # Simple FastAPI app for Railway deployment
-app = FastAPI(title="Micro Credit Risk Analyzer - Railway Backend")
+app = FastAPI(title="Micro Credit Risk Analyzer - Railway Backend",
+              default_response_class=_RESPONSE_CLASS)
 
 # CORS middleware - allow all origins for demo
 app.add_middleware(
@@ -16,87 +54,105 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+_TRAIN_BYTES = _demo_bytes({
+    'success': True,
+    'message': 'Model initialized successfully (Railway Demo)',
+    'accuracies': {
+        'dynamic_scoring': 0.87,
+        'ensemble': 0.85,
+        'blockchain_verified': 0.98
+    },
+    'model_hash': 'railway_demo_v1.0',
+    'blockchain_blocks_created': 5,
+    'training_time': '2.0 seconds'
+})
+
+_ACCURACY_BYTES = _demo_bytes({
+    'model_trained': True,
+    'ensemble_accuracy': 0.85,
+    'blockchain_integrity': 0.98,
+    'blockchain_verified': True,
+    'total_predictions': 25,
+    'model_hash': 'railway_demo_v1.0'
+})
+
+_STATS_BYTES = _demo_bytes({
+    'blockchain_statistics': {
+        'credit_blockchain': {
+            'total_blocks': 25,
+            'average_credit_score': 720
+        },
+        'transaction_blockchain': {
+            'total_blocks': 15,
+            'total_transaction_volume': 150000
+        },
+        'verification_history': [
+            {
+                'blockchain_type': 'credit_score',
+                'average_integrity_score': 0.98,
+                'verification_count': 25
+            }
+        ]
+    }
+})
+
+_VERIFY_BYTES = _demo_bytes({
+    'verification_result': {
+        'valid': True,
+        'total_blocks': 25,
+        'verified_blocks': 25,
+        'integrity_score': 0.98
+    }
+})
+
+_ACCURACY_ETAG = hashlib.md5(_ACCURACY_BYTES).hexdigest()
+_STATS_ETAG = hashlib.md5(_STATS_BYTES).hexdigest()
+_VERIFY_ETAG = hashlib.md5(_VERIFY_BYTES).hexdigest()
+
+_ROOT_BYTES = _demo_bytes({
+    "message": "Micro Credit Risk Analyzer Backend is running on Railway!",
+    "status": "healthy"
+})
+
+_HEALTH_BYTES = _demo_bytes({
+    "status": "healthy",
+    "message": "Railway backend running successfully"
+})
+
 # Simple model training endpoint
 @app.post("/api/ml/train-model")
 async def train_model():
     """Simple model training simulation"""
-    try:
-        # Simulate training time
-        await asyncio.sleep(2)
-        
-        return {
-            'success': True,
-            'message': 'Model initialized successfully (Railway Demo)',
-            'accuracies': {
-                'dynamic_scoring': 0.87,
-                'ensemble': 0.85,
-                'blockchain_verified': 0.98
-            },
-            'model_hash': 'railway_demo_v1.0',
-            'blockchain_blocks_created': 5,
-            'training_time': '2.0 seconds'
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
+    # Simulate training time
+    await asyncio.sleep(2)
+    return Response(content=_TRAIN_BYTES, media_type="application/json")
 
 # Model accuracy endpoint
 @app.get("/api/ml/model-accuracy")
-async def get_model_accuracy():
+async def get_model_accuracy(request: Request):
     """Get model accuracy (demo data)"""
-    return {
-        'model_trained': True,
-        'ensemble_accuracy': 0.85,
-        'blockchain_integrity': 0.98,
-        'blockchain_verified': True,
-        'total_predictions': 25,
-        'model_hash': 'railway_demo_v1.0'
-    }
+    return _cached_json(request, _ACCURACY_BYTES, _ACCURACY_ETAG)
 
 # Blockchain statistics endpoint
 @app.get("/api/blockchain/statistics")
-async def get_blockchain_stats():
+async def get_blockchain_stats(request: Request):
     """Get blockchain statistics (demo data)"""
-    return {
-        'blockchain_statistics': {
-            'credit_blockchain': {
-                'total_blocks': 25,
-                'average_credit_score': 720
-            },
-            'transaction_blockchain': {
-                'total_blocks': 15,
-                'total_transaction_volume': 150000
-            },
-            'verification_history': [
-                {
-                    'blockchain_type': 'credit_score',
-                    'average_integrity_score': 0.98,
-                    'verification_count': 25
-                }
-            ]
-        }
-    }
+    return _cached_json(request, _STATS_BYTES, _STATS_ETAG)
 
 # Blockchain verification endpoint
 @app.get("/api/blockchain/verify-integrity/credit_score")
-async def verify_blockchain_integrity():
+async def verify_blockchain_integrity(request: Request):
     """Verify blockchain integrity (demo data)"""
-    return {
-        'verification_result': {
-            'valid': True,
-            'total_blocks': 25,
-            'verified_blocks': 25,
-            'integrity_score': 0.98
-        }
-    }
+    return _cached_json(request, _VERIFY_BYTES, _VERIFY_ETAG)
 
 # Health check endpoints
 @app.get("/")
 async def root():
-    return {"message": "Micro Credit Risk Analyzer Backend is running on Railway!", "status": "healthy"}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "message": "Railway backend running successfully"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
@@ -106,5 +162,15 @@ if __name__ == "__main__":
     print(f"📡 Server running on port: {port}")
     print("🔗 Ready for Netlify connection")
     print("=" * 60)
-    
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+
+    # uvloop and httptools are optional accelerators (C event loop and HTTP
+    # parser); uvicorn's defaults are used when they are not installed
+    try:
+        import uvloop, httptools  # noqa: F401
+        extra = {'loop': 'uvloop', 'http': 'httptools'}
+    except ImportError:
+        extra = {}
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # The string import form is required for workers > 1
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers,
+                log_level="info", **extra)